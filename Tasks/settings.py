@@ -14,6 +14,8 @@ from pathlib import Path
 import os
 from urllib.parse import urlparse
 
+import orjson
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -58,6 +60,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'django_extensions',
     'task_api',
@@ -65,6 +68,7 @@ INSTALLED_APPS = [
     'drf_spectacular',
     'debug_toolbar',
     'django.contrib.admindocs',
+    'cachalot',
 ]
 
 MIDDLEWARE = [
@@ -112,7 +116,7 @@ db_info = urlparse(DATABASE_URL)
 # БД для запуска в PostgreSQL
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'django.db.backends.postgresql',
         'HOST': '127.0.0.1',
         'PORT': '5432',
         'USER': 'timur',
@@ -137,9 +141,14 @@ CACHES = {
         "LOCATION": os.getenv("REDIS_URL", "redis://localhost:6379/0"),  # Используем переменную окружения
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Сжатые zstd списки задач занимают в Redis в несколько раз меньше памяти
+            "COMPRESSOR": "task_api.caching.TasksCacheCompressor",
         }
     }
 }
+# Кэширование ORM-запросов в Redis (django-cachalot), сбрасывается при записи в таблицу.
+CACHALOT_CACHE = 'default'
+CACHALOT_TIMEOUT = 60 * 60
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -187,6 +196,13 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    # JSON кодируется orjson вместо стандартного json.
+    'DEFAULT_RENDERER_CLASSES': [
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # UTC-даты в формате '...Z', как у DateTimeField в DRF.
+    'ORJSON_RENDERER_OPTIONS': (orjson.OPT_UTC_Z,),
 }
 
 SPECTACULAR_SETTINGS = {
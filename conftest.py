@@ -6,4 +6,9 @@ def django_db_setup():
     settings.DATABASES['default'] = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture(scope='session', autouse=True)
+def fast_password_hashers():
+    # PBKDF2 слишком медленный для тестов, пароли хэшируются MD5.
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
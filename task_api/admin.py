@@ -1,14 +1,45 @@
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.db.models import F
 from .models import *
 # Register your models here.
 class TasksAdmin(admin.ModelAdmin):
-    list_display = ('id', 'title', 'description', 'due_date')
+    list_display = ('id', 'title', 'description', 'due_date', 'user_username')
     list_display_links = ('id', 'title')
-    search_fields = ('title', 'description')
+    # Описание ищется полнотекстово (см. get_search_results), без ILIKE по TextField.
+    search_fields = ('title',)
     list_filter = ('due_date',)
     date_hierarchy = 'due_date'
     ordering = ('due_date',)
-    readonly_fields = ('title', 'description', 'due_date')
+
+    # Задачи в админке только просматриваются: без прав на изменение Django
+    # показывает страницу просмотра и не строит форму редактирования.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        # Имя пользователя берется тем же запросом, объект User не создается;
+        # поисковый вектор не выбирается.
+        return (
+            super().get_queryset(request)
+            .defer('search_vector')
+            .annotate(user_username=F('user__username'))
+        )
+
+    @admin.display(description='Пользователь', ordering='user__username')
+    def user_username(self, obj):
+        return obj.user_username
+
+    def get_search_results(self, request, queryset, search_term):
+        # В PostgreSQL ищем по индексированному search_vector вместо ILIKE по двум колонкам.
+        if not search_term or connection.vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        query = SearchQuery(search_term, config='russian', search_type='websearch')
+        return queryset.filter(search_vector=query), False
 
 
 admin.site.register(Tasks, TasksAdmin)
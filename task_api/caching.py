@@ -0,0 +1,92 @@
+"""
+Кэш списков задач пользователей.
+
+Список задач пользователя кэшируется под ключом, в который входит версия
+(`tasks_ver_<id>`). При изменении задач версия увеличивается, и все ранее
+закэшированные варианты списка становятся недоступны.
+
+Основные компоненты:
+- `tasks_cache_version(user_id)`: текущая версия кэша пользователя.
+- `invalidate_tasks_cache(user_ids)`: сброс кэша нескольких пользователей одним pipeline.
+- `TASKS_CACHE_TIMEOUT`: время жизни закэшированного списка.
+- `TasksCacheCompressor`: сжатие значений кэша в Redis (zstd).
+"""
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from django_redis.compressors.zstd import ZStdCompressor
+import pyzstd
+
+
+# Кэш сбрасывается сигналами при изменении задач (см. signals.py). `QuerySet.update()`
+# и `bulk_create()` сигналов не отправляют, время жизни ограничивает устаревание после них.
+TASKS_CACHE_TIMEOUT = 60 * 5
+
+
+class TasksCacheCompressor(ZStdCompressor):
+    """
+    Компрессор значений кэша для django-redis (zstd, уровень 1).
+
+    Первый уровень сжимает в разы быстрее уровня по умолчанию и почти не
+    уступает ему по размеру, так что сжатие незаметно на фоне round trip до Redis.
+    Значения короче `min_length` хранятся как есть: выигрыша по памяти на них нет,
+    а django-redis при чтении отдает несжатые данные без изменений.
+    """
+    min_length = 1024
+    level = 1
+
+    def compress(self, value):
+        if len(value) > self.min_length:
+            return pyzstd.compress(value, self.level)
+        return value
+
+
+def tasks_cache_version_key(user_id):
+    """
+    Возвращает ключ, под которым хранится версия кэша списка задач пользователя.
+    """
+    return f'tasks_ver_{user_id}'
+
+
+def tasks_cache_version(user_id):
+    """
+    Возвращает текущую версию кэша списка задач пользователя.
+
+    Версия входит в ключ кэша, поэтому после её увеличения старые записи
+    становятся недоступны и истекают сами.
+
+    Args:
+        user_id: Идентификатор пользователя.
+
+    Returns:
+        int: Номер версии.
+    """
+    return cache.get_or_set(tasks_cache_version_key(user_id), 0, timeout=None)
+
+
+def invalidate_tasks_cache(user_ids):
+    """
+    Сбрасывает кэш списков задач пользователей, увеличивая их версии.
+
+    Все INCR отправляются в Redis одним pipeline, то есть за один сетевой
+    round trip независимо от количества пользователей. Сигналы вызывают функцию
+    один раз на транзакцию сразу для всех владельцев измененных задач (см. signals.py).
+
+    Args:
+        user_ids: Идентификаторы пользователей.
+    """
+    try:
+        redis = get_redis_connection('default')
+    except NotImplementedError:
+        # Кэш не в Redis (например, LocMemCache): увеличиваем версии по одной.
+        for user_id in user_ids:
+            version_key = tasks_cache_version_key(user_id)
+            cache.add(version_key, 0, timeout=None)
+            cache.incr(version_key)
+        return
+
+    pipeline = redis.pipeline()
+    for user_id in user_ids:
+        # Отсутствующий ключ INCR создаст со значением 1, версия по умолчанию — 0.
+        pipeline.incr(cache.make_key(tasks_cache_version_key(user_id)))
+    pipeline.execute()
@@ -0,0 +1,54 @@
+"""
+Фильтры списка задач для django-filter.
+
+Класс `TaskFilterSet` объявлен явно, а не строится `DjangoFilterBackend`
+из `filterset_fields` при каждом запросе.
+
+Основные компоненты:
+- `TaskFilterSet`: фильтрация задач по названию, описанию, сроку выполнения и пользователю.
+"""
+
+from django.contrib.auth import get_user_model
+from django_filters import FilterSet, ModelChoiceFilter
+from .models import Tasks
+
+User = get_user_model()
+
+
+def current_user_queryset(request):
+    """
+    Возвращает queryset пользователей, доступных в фильтре `user`.
+
+    Пользователь видит только свои задачи, поэтому выбрать можно только его самого:
+    проверка значения фильтра не требует выборки других пользователей.
+
+    Args:
+        request: Текущий запрос (None при генерации схемы API).
+
+    Returns:
+        QuerySet: Queryset из текущего пользователя.
+    """
+    if request is None:
+        return User.objects.none()
+    return User.objects.filter(pk=request.user.pk)
+
+
+class TaskFilterSet(FilterSet):
+    """
+    Фильтры списка задач.
+
+    Параметры запроса:
+    - `title`, `title__icontains`: Название задачи (точное совпадение или подстрока).
+    - `description`, `description__icontains`: Описание задачи.
+    - `due_date`, `due_date__gte`, `due_date__lte`: Срок выполнения (точно или диапазон).
+    - `user`: Пользователь; допустим только текущий пользователь.
+    """
+    user = ModelChoiceFilter(queryset=current_user_queryset)
+
+    class Meta:
+        model = Tasks
+        fields = {
+            'title': ['exact', 'icontains'],
+            'description': ['exact', 'icontains'],
+            'due_date': ['exact', 'gte', 'lte'],
+        }
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-15 08:56
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_api', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tasks',
+            name='due_date',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Срок выполнения'),
+        ),
+        migrations.AddIndex(
+            model_name='tasks',
+            index=models.Index(fields=['user', '-due_date'], name='tasks_user_due_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    django.contrib.postgres.indexes.GinIndex(
+        fields=['title'], name='tasks_title_trgm', opclasses=['gin_trgm_ops'],
+    ),
+    django.contrib.postgres.indexes.GinIndex(
+        fields=['description'], name='tasks_description_trgm', opclasses=['gin_trgm_ops'],
+    ),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # GIN-индексы с gin_trgm_ops есть только в PostgreSQL (тесты идут на SQLite).
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Tasks = apps.get_model('task_api', 'Tasks')
+    for index in TRIGRAM_INDEXES:
+        schema_editor.add_index(Tasks, index)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Tasks = apps.get_model('task_api', 'Tasks')
+    for index in TRIGRAM_INDEXES:
+        schema_editor.remove_index(Tasks, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_api', '0002_tasks_due_date_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                TrigramExtension(),
+                migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='tasks', index=index)
+                for index in TRIGRAM_INDEXES
+            ],
+        ),
+    ]
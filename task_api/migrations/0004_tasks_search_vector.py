@@ -0,0 +1,72 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['search_vector'], name='tasks_search_vector_idx',
+)
+
+# Поисковый вектор: название весомее описания. Конфигурация 'russian'
+# стеммит и русские, и латинские слова.
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION task_api_tasks_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('russian', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('russian', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER task_api_tasks_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON task_api_tasks
+    FOR EACH ROW EXECUTE FUNCTION task_api_tasks_search_vector_update();
+
+UPDATE task_api_tasks SET title = title;
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS task_api_tasks_search_vector_trigger ON task_api_tasks;
+DROP FUNCTION IF EXISTS task_api_tasks_search_vector_update();
+"""
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    # Триггер и GIN-индекс есть только в PostgreSQL (тесты идут на SQLite).
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Tasks = apps.get_model('task_api', 'Tasks')
+    schema_editor.add_index(Tasks, SEARCH_VECTOR_INDEX)
+    schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Tasks = apps.get_model('task_api', 'Tasks')
+    schema_editor.execute(DROP_TRIGGER_SQL)
+    schema_editor.remove_index(Tasks, SEARCH_VECTOR_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_api', '0003_tasks_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasks',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='tasks', index=SEARCH_VECTOR_INDEX),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-15 09:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_api', '0005_tasks_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Новый индекс создается до удаления старого, чтобы выборка не оставалась без индекса.
+        migrations.AddIndex(
+            model_name='tasks',
+            index=models.Index(fields=['user', '-due_date', '-id'], name='tasks_user_due_id_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='tasks',
+            name='tasks_user_due_idx',
+        ),
+    ]
@@ -9,11 +9,15 @@
     - `title` (CharField): Название задачи с максимальной длиной 200 символов.
     - `description` (TextField): Подробное описание задачи.
     - `due_date` (DateTimeField): Срок выполнения задачи, по умолчанию устанавливается на текущее время.
+    - `updated_at` (DateTimeField): Дата последнего изменения задачи, обновляется автоматически.
     - `user` (ForeignKey): Связь с моделью пользователя, указывающая, какому пользователю принадлежит задача.
+    - `search_vector` (SearchVectorField): Поисковый вектор по названию и описанию, поддерживается триггером PostgreSQL.
 
 Мета-класс:
 - `verbose_name`: имя модели в единственном числе ("Задача").
 - `verbose_name_plural`: имя модели во множественном числе ("Задачи").
+- `indexes`: составной индекс по (`user`, `due_date`, `id`) для выборки задач пользователя по сроку
+  и GIN-индексы для поиска по подстроке (`title`, `description`) и полнотекстового поиска (`search_vector`).
 
 Методы:
 - `__str__()`: Возвращает строковое представление задачи, представляя её название.
@@ -29,6 +33,8 @@
 """
 
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.conf import settings
@@ -44,11 +50,16 @@ class Tasks(models.Model):
         - title (CharField): Название задачи. Максимальная длина — 200 символов.
         - description (TextField): Подробное описание задачи.
         - due_date (DateTimeField): Срок выполнения задачи. По умолчанию устанавливается текущая дата и время.
+        - updated_at (DateTimeField): Дата последнего изменения задачи. Обновляется при каждом сохранении.
         - user (ForeignKey): Связь с моделью пользователя (User). Задача принадлежит одному пользователю.
+        - search_vector (SearchVectorField): Поисковый вектор (title + description) для полнотекстового поиска.
+          Заполняется триггером PostgreSQL, вручную не редактируется.
 
     Мета-класс:
         - verbose_name: Человекочитаемое имя модели в единственном числе ("Задача").
         - verbose_name_plural: Человекочитаемое имя модели во множественном числе ("Задачи").
+        - indexes: Составной индекс по (user, due_date, id) для выборки задач пользователя по сроку
+          и GIN-индексы: триграммные (pg_trgm) по title и description и полнотекстовый по search_vector.
 
     Методы:
         - __str__(): Возвращает строковое представление задачи (название задачи).
@@ -64,13 +75,26 @@ class Tasks(models.Model):
     """
     title = models.CharField(max_length=200, verbose_name="Название Задачи")
     description = models.TextField(verbose_name="Описание Задачи")
-    due_date = models.DateTimeField(default=timezone.now, verbose_name="Срок выполнения")
+    due_date = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="Срок выполнения")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата изменения")
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
         related_name="tasks", verbose_name="Пользователь")
+    # Заполняется триггером PostgreSQL из title и description (см. миграцию 0004).
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         verbose_name = "Задача"
         verbose_name_plural = "Задачи"
+        indexes = [
+            # Задачи пользователя, отсортированные по сроку выполнения; `id` различает
+            # задачи с одинаковым сроком, порядок совпадает с сортировкой TaskViewSet.
+            models.Index(fields=['user', '-due_date', '-id'], name='tasks_user_due_id_idx'),
+            # Триграммные индексы для поиска по подстроке (`icontains`) в PostgreSQL.
+            GinIndex(fields=['title'], name='tasks_title_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='tasks_description_trgm', opclasses=['gin_trgm_ops']),
+            # Полнотекстовый поиск по search_vector.
+            GinIndex(fields=['search_vector'], name='tasks_search_vector_idx'),
+        ]
 
     def __str__(self):
         return self.title
\ No newline at end of file
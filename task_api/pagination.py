@@ -0,0 +1,25 @@
+"""
+Пагинация списка задач.
+
+Основные компоненты:
+- `TaskCursorPagination`: курсорная пагинация задач по сроку выполнения.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация списка задач.
+
+    Следующая страница выбирается условием по `due_date` и `id` последней задачи
+    (`WHERE ... < курсор LIMIT n`), а не через `OFFSET`: стоимость страницы не растет
+    с ее номером и читается по индексу `tasks_user_due_id_idx`.
+    Общее количество задач (`count`) не считается.
+
+    Атрибуты:
+        page_size (int): Количество задач на странице.
+        ordering (tuple): Сортировка по умолчанию, совпадает с `TaskViewSet.ordering`.
+    """
+    page_size = 50
+    ordering = ('-due_date', '-id')
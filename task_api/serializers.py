@@ -47,9 +47,6 @@
 """
 
 from rest_framework import serializers
-from django.contrib.auth.models import User
-
-from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework.serializers import ModelSerializer
 from .models import Tasks
@@ -65,7 +62,8 @@ class UserRegistrationSerializer(ModelSerializer):
     (не возвращается в ответе) и должен содержать минимум 8 символов.
 
     Атрибуты:
-        password (CharField): Поле для пароля. Только для записи, минимальная длина — 8 символов.
+        password (CharField): Поле для пароля. Только для записи, минимальная длина — 8 символов
+            (проверяется самим полем через `min_length`).
 
     Мета-класс:
         model (User): Модель, с которой работает сериализатор.
@@ -73,7 +71,6 @@ class UserRegistrationSerializer(ModelSerializer):
         extra_kwargs (dict): Дополнительные параметры для полей. Например, `email` является обязательным.
 
     Методы:
-        validate_password(value): Валидирует пароль, проверяя его длину.
         create(validated_data): Создает нового пользователя с хэшированным паролем.
 
     Пример использования:
@@ -85,7 +82,11 @@ class UserRegistrationSerializer(ModelSerializer):
         if serializer.is_valid():
             user = serializer.save()
     """
-    password = serializers.CharField(write_only=True, min_length=8)
+    password = serializers.CharField(
+        write_only=True,
+        min_length=8,
+        error_messages={'min_length': "Пароль должен содержать минимум 8 символов."},
+    )
 
     class Meta:
         model = User
@@ -94,25 +95,6 @@ class UserRegistrationSerializer(ModelSerializer):
             'email': {'required': True},  # Делаем email обязательным полем
         }
 
-    def validate_password(self, value):
-        """
-        Метод валидирует пароль.
-
-        Проверяет, что пароль содержит минимум 8 символов.
-
-        Аргументы:
-            value (str): Пароль, который нужно валидировать.
-
-        Возвращает:
-            str: Валидный пароль.
-
-        Исключения:
-            ValidationError: Если пароль короче 8 символов.
-        """
-        if len(value) < 8:
-            raise serializers.ValidationError("Пароль должен содержать минимум 8 символов.")
-        return value
-
     def create(self, validated_data):
         """
         Создает нового пользователя с хэшированным паролем.
@@ -0,0 +1,86 @@
+"""
+Сигналы модели `Tasks`.
+
+После сохранения или удаления задачи сбрасывается кэш списка задач её владельца.
+Сброс выполняется после фиксации транзакции (`transaction.on_commit`), чтобы
+параллельный запрос не закэшировал данные, которые ещё не видны в базе.
+Владельцы всех задач, измененных в одной транзакции (массовое удаление в админке,
+каскадное удаление), собираются вместе, и их кэш сбрасывается один раз.
+Так кэш остается согласованным при любом способе изменения задач: через API,
+админку или ORM.
+
+Примечание: `QuerySet.update()` и `bulk_create()` сигналы не отправляют,
+после них список обновится по истечении `TASKS_CACHE_TIMEOUT`, а ETag списка
+не изменится до следующего сброса кэша (см. `views.tasks_etag`).
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_tasks_cache
+from .models import Tasks
+
+
+class PendingTasksCacheInvalidation:
+    """
+    Владельцы задач, измененных в текущей транзакции соединения.
+
+    Объект регистрируется в `on_commit` один раз на транзакцию и после фиксации
+    сбрасывает кэш всех собранных пользователей одним вызовом `invalidate_tasks_cache`
+    (один pipeline Redis).
+
+    Атрибуты:
+        connection: Соединение с базой данных, в транзакции которого изменены задачи.
+        user_ids (set): Идентификаторы владельцев измененных задач.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.user_ids = set()
+
+    def __call__(self):
+        if getattr(self.connection, 'pending_tasks_cache_invalidation', None) is self:
+            self.connection.pending_tasks_cache_invalidation = None
+        invalidate_tasks_cache(self.user_ids)
+
+    def is_scheduled(self):
+        """
+        Проверяет, что объект еще ждет фиксации и зарегистрирован в текущей точке сохранения.
+
+        При откате транзакции (или точки сохранения, в которой объект был
+        зарегистрирован) Django отменяет обработчик, поэтому изменения во вложенном
+        `atomic()` собираются в отдельный объект: его откат не теряет сброс кэша
+        для изменений внешнего блока.
+
+        Returns:
+            bool: True, если обработчик зарегистрирован в текущем блоке `atomic()`.
+        """
+        savepoint_ids = set(self.connection.savepoint_ids)
+        return any(
+            func is self and sids == savepoint_ids
+            for sids, func, _ in self.connection.run_on_commit
+        )
+
+
+@receiver(post_save, sender=Tasks)
+@receiver(post_delete, sender=Tasks)
+def invalidate_user_tasks_cache(sender, instance, using, **kwargs):
+    """
+    Сбрасывает кэш списка задач владельца задачи после фиксации транзакции.
+
+    Args:
+        sender: Модель `Tasks`.
+        instance (Tasks): Сохраненная или удаленная задача.
+        using (str): Псевдоним базы данных.
+    """
+    connection = transaction.get_connection(using)
+    pending = getattr(connection, 'pending_tasks_cache_invalidation', None)
+    schedule = pending is None or not pending.is_scheduled()
+    if schedule:
+        pending = PendingTasksCacheInvalidation(connection)
+        connection.pending_tasks_cache_invalidation = pending
+    pending.user_ids.add(instance.user_id)
+    if schedule:
+        # Вне транзакции обработчик выполняется сразу, поэтому id добавляется до регистрации.
+        transaction.on_commit(pending, using=using)
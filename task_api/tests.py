@@ -1,30 +1,59 @@
-from django.test import TestCase
+from unittest import mock
+from django.test import SimpleTestCase, TestCase, override_settings
+from django_redis.client import DefaultClient
+from django_redis.exceptions import CompressorError
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
 from .models import Tasks
-from rest_framework.test import APIClient
+from .serializers import TaskSerializer
+from .views import TaskViewSet
+from .pagination import TaskCursorPagination
+from .caching import (
+    TasksCacheCompressor, invalidate_tasks_cache, tasks_cache_version, tasks_cache_version_key,
+)
+from rest_framework.test import APIClient, APIRequestFactory
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib.auth.models import User
 
 
 User  = get_user_model()
 
+# Тесты не должны очищать и заполнять Redis из настроек (кэш списков задач, django-cachalot).
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
 
+
+@override_settings(CACHES=TEST_CACHES)
 class TaskAPITests(APITestCase):
-    def setUp(self):
-        # Создаем тестового пользователя
-        self.user = User.objects.create_user(username='testuser', password='testpass')
-        self.client = APIClient()
-        self.client.login(username='testuser', password='testpass')
+    @classmethod
+    def setUpTestData(cls):
+        # Создаем тестового пользователя (один раз на класс)
+        cls.user = User.objects.create_user(username='testuser', password='testpass')
 
         # Создаем тестовую задачу
-        self.task = Tasks.objects.create(
+        cls.task = Tasks.objects.create(
             title='Test Task',
             description='Task Description',
-            user=self.user
+            user=cls.user
         )
 
+    @classmethod
+    def bulk_tasks(cls, user, n):
+        """
+        Создает `n` задач пользователя одним INSERT-запросом.
+        """
+        return Tasks.objects.bulk_create(
+            [Tasks(title=f'Task {i}', description='Task Description', user=user) for i in range(n)]
+        )
+
+    def setUp(self):
+        # Кэш списка задач не должен переживать отдельный тест
+        cache.clear()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
     # def test_user_registration(self):
     #     """
     #     Тест регистрации нового пользователя.
@@ -61,8 +90,167 @@ class TaskAPITests(APITestCase):
         url = reverse('task_api:tasks-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], self.task.title)
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertEqual(response.json()['results'][0]['title'], self.task.title)
+
+    def test_list_tasks_matches_serializer(self):
+        """
+        Тест совпадения формата списка задач с `TaskSerializer`.
+        """
+        url = reverse('task_api:tasks-list')
+        response = self.client.get(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'], [TaskSerializer(self.task).data])
+
+    def test_list_tasks_cached_payload(self):
+        """
+        Тест отдачи списка задач из кэша в том же виде, что и без кэша.
+        """
+        url = reverse('task_api:tasks-list')
+        first = self.client.get(url)
+        second = self.client.get(url)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second['Content-Type'], 'application/json')
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.content, first.content)
+
+        response = self.client.get(url, HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_list_tasks_browsable_api_skips_cache(self):
+        """
+        Тест того, что запрос Browsable API не обращается к кэшу списка задач.
+        """
+        url = reverse('task_api:tasks-list')
+        response = self.client.get(url, HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(tasks_cache_version_key(self.user.id)))
+
+    def test_list_tasks_cache_invalidated(self):
+        """
+        Тест сброса кэша списка задач после создания задачи.
+        """
+        url = reverse('task_api:tasks-list')
+        self.assertEqual(len(self.client.get(url).json()['results']), 1)
+
+        data = {'title': 'New Task', 'description': 'New Task Description'}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, data, format='json')
+        response = self.client.get(url)
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_list_tasks_cache_invalidated_on_model_change(self):
+        """
+        Тест сброса кэша списка задач при изменении задачи в обход API (админка, ORM).
+        """
+        url = reverse('task_api:tasks-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = 'Changed Task'
+            self.task.save()
+        response = self.client.get(url)
+        self.assertEqual(response.json()['results'][0]['title'], 'Changed Task')
+
+    def test_list_tasks_cached_per_query(self):
+        """
+        Тест раздельного кэширования списка задач для разных параметров запроса.
+        """
+        self.bulk_tasks(self.user, 1)
+        url = reverse('task_api:tasks-list')
+        self.assertEqual(len(self.client.get(url).json()['results']), 2)
+
+        response = self.client.get(url, {'search': 'Test'})
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertEqual(response.json()['results'][0]['title'], self.task.title)
+
+    def test_list_tasks_filtered(self):
+        """
+        Тест фильтрации списка задач через `TaskFilterSet`.
+        """
+        self.bulk_tasks(self.user, 1)
+        url = reverse('task_api:tasks-list')
+        response = self.client.get(url, {'title__icontains': 'test'})
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertEqual(response.json()['results'][0]['title'], self.task.title)
+
+        response = self.client.get(url, {'user': self.user.id})
+        self.assertEqual(len(response.json()['results']), 2)
+
+        other_user = User.objects.create_user(username='otheruser', password='otherpass')
+        response = self.client.get(url, {'user': other_user.id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_tasks_cache_invalidated_for_all_queries(self):
+        """
+        Тест сброса кэша всех вариантов списка задач одним изменением.
+        """
+        url = reverse('task_api:tasks-list')
+        queries = [{}, {'search': 'Task'}, {'ordering': 'due_date'}]
+        for query in queries:
+            self.client.get(url, query)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse('task_api:tasks-detail', args=[self.task.id]), {'title': 'Changed Task'}, format='json')
+        for query in queries:
+            response = self.client.get(url, query)
+            self.assertEqual(response.json()['results'][0]['title'], 'Changed Task')
+
+    def test_list_tasks_paginated(self):
+        """
+        Тест разбиения списка задач на страницы.
+        """
+        page_size = TaskCursorPagination.page_size
+        self.bulk_tasks(self.user, page_size)
+        url = reverse('task_api:tasks-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), page_size)
+        self.assertIsNotNone(response.json()['next'])
+
+        # Следующая страница выбирается по курсору и кэшируется под своим ключом.
+        response = self.client.get(response.json()['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 1)
+        self.assertIsNone(response.json()['next'])
+
+    def test_list_tasks_not_modified(self):
+        """
+        Тест условного запроса списка задач по ETag.
+        """
+        url = reverse('task_api:tasks-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        # ETag берется из версии кэша, база данных не запрашивается.
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(reverse('task_api:tasks-detail', args=[self.task.id]), {'title': 'Changed'}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'][0]['title'], 'Changed')
+
+    def test_list_tasks_etag_changes_on_delete(self):
+        """
+        Тест смены ETag списка задач после удаления задачи.
+        """
+        self.bulk_tasks(self.user, 1)
+        url = reverse('task_api:tasks-list')
+        etag = self.client.get(url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('task_api:tasks-detail', args=[self.task.id]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 1)
 
     def test_retrieve_task(self):
         """
@@ -73,6 +261,17 @@ class TaskAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], self.task.title)
 
+    def test_task_owner_without_query(self):
+        """
+        Тест того, что владелец задачи не загружается отдельным запросом.
+        """
+        request = APIRequestFactory().get('/')
+        request.user = self.user
+        view = TaskViewSet(request=request)
+        task = view.get_queryset().get(pk=self.task.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(task.user, self.user)
+
     def test_update_task(self):
         """
         Тест обновления задачи.
@@ -124,7 +323,10 @@ class TaskAPITests(APITestCase):
             'title': 'Attempted Update',
         }
         response = self.client.put(url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        # Чужие задачи не попадают в выборку пользователя
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        task.refresh_from_db()
+        self.assertEqual(task.title, 'Other User Task')
 
     def test_destroy_task_not_owner(self):
         """
@@ -138,6 +340,159 @@ class TaskAPITests(APITestCase):
         )
         url = reverse('task_api:tasks-detail', args=[task.id])
         response = self.client.delete(url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        # Чужие задачи не попадают в выборку пользователя
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Tasks.objects.filter(id=task.id).exists())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class UserAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', email='test@example.com', password='testpass')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_retrieve_self_without_query(self):
+        """
+        Тест получения данных текущего пользователя без запроса к базе данных.
+        """
+        url = reverse('task_api:user-detail', args=[self.user.id])
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'testuser')
+
+    def test_retrieve_other_user(self):
+        """
+        Тест получения данных другого пользователя.
+        """
+        other_user = User.objects.create_user(username='otheruser', password='otherpass')
+        url = reverse('task_api:user-detail', args=[other_user.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'otheruser')
+
+
+@override_settings(CACHES=TEST_CACHES)
+class UserRegistrationTests(APITestCase):
+    def test_short_password(self):
+        """
+        Тест отклонения пароля короче 8 символов.
+        """
+        url = reverse('task_api:user-registration')
+        data = {
+            'username': 'newuser',
+            'email': 'newuser@example.com',
+            'password': 'short',
+        }
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['password'], ["Пароль должен содержать минимум 8 символов."])
+        self.assertFalse(User.objects.filter(username='newuser').exists())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TasksCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_invalidated_once_per_transaction(self):
+        """
+        Тест сброса кэша всех затронутых пользователей одним вызовом после фиксации транзакции.
+        """
+        users = [User.objects.create_user(username=f'user{i}', password='testpass') for i in range(2)]
+        for user in users:
+            TaskAPITests.bulk_tasks(user, 3)
+
+        with mock.patch('task_api.signals.invalidate_tasks_cache') as invalidate:
+            with self.captureOnCommitCallbacks(execute=True):
+                Tasks.objects.all().delete()
+        invalidate.assert_called_once_with({user.id for user in users})
+
+    def test_transaction_invalidated_through_one_pipeline(self):
+        """
+        Тест сброса кэша владельцев задач, удаленных в одной транзакции, одним pipeline Redis.
+        """
+        users = [User.objects.create_user(username=f'user{i}', password='testpass') for i in range(3)]
+        for user in users:
+            TaskAPITests.bulk_tasks(user, 2)
+
+        redis = mock.Mock()
+        with mock.patch('task_api.caching.get_redis_connection', return_value=redis):
+            with self.captureOnCommitCallbacks(execute=True):
+                Tasks.objects.all().delete()
+
+        redis.pipeline.assert_called_once_with()
+        pipeline = redis.pipeline.return_value
+        self.assertCountEqual(
+            pipeline.incr.call_args_list,
+            [mock.call(cache.make_key(tasks_cache_version_key(user.id))) for user in users],
+        )
+        pipeline.execute.assert_called_once_with()
+
+    def test_invalidate_through_redis_pipeline(self):
+        """
+        Тест сброса кэша нескольких пользователей одним pipeline Redis.
+        """
+        user_ids = [1, 2, 3]
+        # Ключи в Redis (с префиксом и версией кэша) -> ключи django cache.
+        version_keys = {cache.make_key(tasks_cache_version_key(user_id)): tasks_cache_version_key(user_id)
+                        for user_id in user_ids}
+
+        def redis_incr(key):
+            # INCR Redis: отсутствующий ключ создается со значением 0 и увеличивается.
+            cache.add(version_keys[key], 0, timeout=None)
+            return cache.incr(version_keys[key])
+
+        redis = mock.Mock()
+        redis.pipeline.return_value.incr.side_effect = redis_incr
+        with mock.patch('task_api.caching.get_redis_connection', return_value=redis) as get_connection:
+            invalidate_tasks_cache(user_ids)
+
+        get_connection.assert_called_once_with('default')
+        redis.pipeline.assert_called_once_with()
+        pipeline = redis.pipeline.return_value
+        self.assertEqual(pipeline.incr.call_args_list, [mock.call(key) for key in version_keys])
+        pipeline.execute.assert_called_once_with()
+        for user_id in user_ids:
+            self.assertEqual(tasks_cache_version(user_id), 1)
+
+
+class TasksCacheCompressorTests(SimpleTestCase):
+    def setUp(self):
+        self.compressor = TasksCacheCompressor(options={})
+        # Клиент django-redis с компрессором из настроек; к Redis он не подключается.
+        self.client = DefaultClient(
+            'redis://localhost:6379/0', {'OPTIONS': {'COMPRESSOR': 'task_api.caching.TasksCacheCompressor'}}, None,
+        )
+
+    def test_large_value_compressed(self):
+        """
+        Тест сжатия значения больше `min_length` и его восстановления.
+        """
+        value = b'{"title": "Task", "description": "Task Description"},' * 100
+        self.assertGreater(len(value), TasksCacheCompressor.min_length)
+        compressed = self.compressor.compress(value)
+        self.assertLess(len(compressed), len(value))
+        self.assertEqual(self.compressor.decompress(compressed), value)
+        self.assertEqual(self.client.decode(self.client.encode(value)), value)
+
+    def test_small_value_not_compressed(self):
+        """
+        Тест хранения значения не больше `min_length` без сжатия.
+        """
+        value = b'x' * TasksCacheCompressor.min_length
+        self.assertEqual(self.compressor.compress(value), value)
+        # Несжатое значение django-redis отдает как есть через CompressorError.
+        with self.assertRaises(CompressorError):
+            self.compressor.decompress(value)
 
+        payload = {'results': []}
+        self.assertEqual(self.client.decode(self.client.encode(payload)), payload)
+        # Версии кэша хранятся в Redis числами, чтобы работал INCR.
+        self.assertEqual(self.client.encode(1), 1)
+        self.assertEqual(self.client.decode(b'2'), 2)
 
@@ -1,7 +1,6 @@
 from django.urls import path,include
-from .views import UserRegistrationView
 from rest_framework.routers import DefaultRouter
-from task_api.views import TaskViewSet, UserViewSet
+from .views import UserRegistrationView, TaskViewSet, UserViewSet
 
 app_name = 'task_api'
 router = DefaultRouter()
@@ -10,6 +9,5 @@ router.register(r'users', UserViewSet, basename='user')
 
 urlpatterns = [
     path('register/', UserRegistrationView.as_view(), name='user-registration'),
-    path('tasks/', include(router.urls)),
-    path('users/', include(router.urls)),
+    path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -55,25 +55,54 @@
     }
 """
 
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, viewsets
 from rest_framework.response import Response
-from .serializers import UserRegistrationSerializer
-from django.contrib.auth import get_user_model
-from .models import Tasks
-from rest_framework import viewsets, status
-from .serializers import TaskSerializer, UserSerializer
 from rest_framework.permissions import IsAuthenticated,IsAdminUser
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from .models import Tasks
+from .serializers import UserRegistrationSerializer, TaskSerializer, UserSerializer
+from .filters import TaskFilterSet
+from .pagination import TaskCursorPagination
+from .caching import TASKS_CACHE_TIMEOUT, tasks_cache_version
+import hashlib
 import logging
+from urllib.parse import urlencode
 
 
+User = get_user_model()
+
 logger = logging.getLogger(__name__)
 
 
+def tasks_etag(request, *args, **kwargs):
+    """
+    Вычисляет ETag списка задач текущего пользователя по версии его кэша.
+
+    Версия (`tasks_ver_<id>`) увеличивается сигналами при создании, изменении и
+    удалении любой задачи пользователя, поэтому ETag берется из Redis без запроса
+    к базе данных. ETag отдается только для JSON: Browsable API кэш не использует.
+
+    Ограничение: `QuerySet.update()` и `bulk_create()` сигналов не отправляют и версию
+    не меняют. Кэш после них устаревает не дольше `TASKS_CACHE_TIMEOUT`, а ETag остается
+    прежним до следующего изменения задач через `save()`/`delete()`, и клиент с ним
+    получает 304. Такие массовые изменения должны сбрасывать кэш сами
+    (`invalidate_tasks_cache`).
+
+    Returns:
+        str | None: Значение ETag или None, если ответ не в JSON.
+    """
+    if request.accepted_renderer.format != 'json':
+        return None
+    user_id = request.user.id
+    return f'W/"{user_id}-{tasks_cache_version(user_id)}"'
+
 
-logger = logging.getLogger(__name__)
 class UserRegistrationView(generics.CreateAPIView):
     """
     Представление для регистрации нового пользователя.
@@ -134,8 +163,6 @@ class UserRegistrationView(generics.CreateAPIView):
         })
 
 
-
-
 class TaskViewSet(viewsets.ModelViewSet):
     """
     ViewSet для работы с задачами (Tasks).
@@ -144,9 +171,9 @@ class TaskViewSet(viewsets.ModelViewSet):
     - `list`: Возвращает список задач, созданных текущим пользователем.
     - `retrieve`: Возвращает детали конкретной задачи.
     - `create`: Создает новую задачу, автоматически привязывая её к текущему пользователю.
-    - `update`: Обновляет данные задачи. Доступно только для владельца задачи.
-    - `partial_update`: Частично обновляет данные задачи. Доступно только для владельца задачи.
-    - `destroy`: Удаляет задачу. Доступно только для владельца задачи.
+    - `update`: Обновляет данные задачи.
+    - `partial_update`: Частично обновляет данные задачи.
+    - `destroy`: Удаляет задачу.
 
     Поля, возвращаемые в API:
     - `id`: Уникальный идентификатор задачи.
@@ -157,16 +184,26 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     Права доступа:
     - Только аутентифицированные пользователи могут выполнять любые действия с задачами.
-    - Пользователь может работать только с задачами, которые он создал.
+    - Пользователь может работать только с задачами, которые он создал: `get_queryset`
+      выбирает только его задачи, поэтому на чужую задачу возвращается 404.
 
     Фильтрация, поиск и сортировка:
-    - `search_fields`: Поиск по полям `title`, `description`, `due_date`, `user`.
-    - `filterset_fields`: Фильтрация по полям `title`, `description`, `due_date`, `user`.
+    - `search_fields`: Поиск по полям `title`, `description`.
+    - `filterset_class`: Фильтрация по полям `title`, `description`, `due_date`, `user` (`TaskFilterSet`).
     - `ordering_fields`: Сортировка по полям `due_date`, `user`.
+    - `ordering`: По умолчанию задачи отсортированы по убыванию `due_date` (затем `id`).
+
+    Пагинация:
+    - Список задач разбивается на страницы курсором (`TaskCursorPagination`, 50 задач на странице).
+
+    Список задач (`list`) формируется через `.values()` в обход `TaskSerializer`.
 
     Кэширование:
-    - GET-запросы кэшируются с использованием Redis.
-    - Кэш очищается при создании, обновлении или удалении задачи.
+    - Список задач поддерживает условные запросы (`ETag`, ответ 304).
+    - Страницы списка кэшируются в Redis отдельно для каждой комбинации параметров запроса.
+    - Кэш сбрасывается сигналами `post_save`/`post_delete` модели `Tasks` после фиксации
+      транзакции увеличением версии в ключе (`tasks_ver_<id>`), а не удалением записи:
+      читатель не может вернуть в кэш устаревшие данные уже после записи.
     """
     queryset = Tasks.objects.all()
     serializer_class = TaskSerializer
@@ -176,159 +213,121 @@ class TaskViewSet(viewsets.ModelViewSet):
         DjangoFilterBackend,
         OrderingFilter,
     ]
-    # Отображается поле поиска.
-    search_fields = ['title', 'description', 'due_date', 'user']
+    # Отображается поле поиска. Поиск только по текстовым полям с триграммными индексами;
+    # по сроку выполнения задачи фильтруются через filterset_class.
+    search_fields = ['title', 'description']
 
-    # Отображается поле фильтрации.
-    filterset_fields = [
-        'title',
-        'description',
-        'due_date',
-        'user'
-    ]
+    # Отображается поле фильтрации. Класс фильтров объявлен заранее (см. filters.py).
+    filterset_class = TaskFilterSet
     # Отображается поле сортировки.
     ordering_fields = [
         'due_date',
         'user',
     ]
+    # Курсорная пагинация: стоимость страницы не зависит от ее номера.
+    pagination_class = TaskCursorPagination
+    # Сортировка по умолчанию, нужна для стабильной пагинации. `id` различает задачи
+    # с одинаковым сроком; порядок совпадает с индексом `tasks_user_due_id_idx`,
+    # поэтому задачи пользователя читаются по индексу без отдельной сортировки.
+    ordering = ['-due_date', '-id']
+    # Поля задачи в ответе `list`, выбираются через `.values()` без создания моделей.
+    # Берутся из TaskSerializer, чтобы список и детальный ответ не расходились.
+    list_fields = TaskSerializer.Meta.fields
 
     def get_queryset(self):
         """
         Возвращает queryset задач, созданных текущим пользователем.
+        Выборка строится через `request.user.tasks`, поэтому у каждой задачи
+        поле `user` сразу указывает на `request.user`: ни JOIN, ни отдельного
+        запроса на каждую задачу не требуется.
+        Поисковый вектор `search_vector` в API не нужен и не выбирается.
 
         Returns:
             QuerySet: Список задач, принадлежащих текущему пользователю.
         """
-        logger.info("Запрос задач")
-        return self.queryset.filter(user=self.request.user)
+        return self.request.user.tasks.defer('search_vector')
 
-    def list(self, request, *args, **kwargs):
+    def get_list_cache_key(self, request):
         """
-        Возвращает список задач, созданных текущим пользователем.
-        Результат кэшируется с использованием Redis.
+        Возвращает ключ кэша списка задач для текущего запроса.
 
-        Returns:
-            Response: Список задач в формате JSON.
-        """
-        cache_key = f'tasks_{request.user.id}'  # Уникальный ключ для кэша
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            logger.info("Данные получены из кэша")
-            return Response(cached_data)
-
-        # Если данных нет в кэше, выполняем запрос к базе данных.
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
+        Ключ состоит из id пользователя, версии кэша (меняется при каждом изменении
+        задач) и хэша параметров запроса: фильтры, поиск, сортировка и страница
+        (курсор `cursor`) кэшируются отдельно друг от друга.
 
-        # Кэшируем данные на 5 минут (300 секунд)
-        cache.set(cache_key, data, timeout=300)
-        logger.info("Данные закэшированы")
-
-        return Response(data)
-
-    def perform_create(self, serializer):
-        """
-        Автоматически привязывает задачу к текущему пользователю при создании.
-        Очищает кэш для текущего пользователя.
-
-        Args:
-            serializer: Сериализатор для создания задачи.
+        Returns:
+            str: Ключ кэша вида `tasks_<id>_v<версия>_<хэш параметров>`.
         """
-        serializer.save(user=self.request.user)
-        cache_key = f'tasks_{self.request.user.id}'
-        cache.delete(cache_key)  # Очищаем кэш после создания задачи
-        logger.info("Кэш очищен после создания задачи")
+        query_string = urlencode(sorted(request.query_params.lists()), doseq=True)
+        params_hash = hashlib.blake2b(query_string.encode(), digest_size=8).hexdigest()
+        user_id = request.user.id
+        return f'tasks_{user_id}_v{tasks_cache_version(user_id)}_{params_hash}'
 
-    def update(self, request, *args, **kwargs):
+    # Last-Modified не используется: ETag берется из версии кэша без запроса к базе данных.
+    @method_decorator(condition(etag_func=tasks_etag))
+    def list(self, request, *args, **kwargs):
         """
-        Обновляет задачу. Доступно только для владельца задачи.
-        Очищает кэш для текущего пользователя.
-
-        Args:
-            request: Запрос от клиента.
-            *args: Дополнительные аргументы.
-            **kwargs: Дополнительные именованные аргументы.
+        Возвращает список задач, созданных текущим пользователем.
+        Строки выбираются через `.values()` и отдаются без `TaskSerializer`:
+        модели и поля сериализатора на каждую задачу не создаются.
+        Ответ разбивается на страницы (`TaskCursorPagination`), поэтому объём
+        выборки и ответа ограничен размером страницы.
+        Каждая комбинация параметров запроса кэшируется в Redis в виде готового JSON
+        и отдается через `HttpResponse` без повторной сериализации и рендеринга;
+        заголовок `X-Cache` (`HIT`/`MISS`) показывает, взят ли ответ из кэша.
+        Ответ содержит заголовок `ETag` (версия кэша); если данные не изменились,
+        на запрос с `If-None-Match` возвращается 304 без обращения к базе данных.
 
         Returns:
-            Response: Ответ с обновленными данными задачи или ошибкой 403, если пользователь не является владельцем.
+            HttpResponse | Response: Страница списка задач в формате JSON.
         """
-        instance = self.get_object()
+        # В кэше хранится готовый JSON, для Browsable API кэш не используется.
+        if request.accepted_renderer.format != 'json':
+            return Response(self.get_list_data())
 
-        # Проверяем, что текущий пользователь является владельцем задачи
-        if instance.user != request.user:
-            return Response(
-                {"detail": "У вас нет прав на обновление этой задачи."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
+        cache_key = self.get_list_cache_key(request)
+        cached_payload = cache.get(cache_key)
+        if cached_payload is not None:
+            logger.debug("Данные получены из кэша")
+            return HttpResponse(cached_payload, content_type=request.accepted_renderer.media_type,
+                                headers={'X-Cache': 'HIT'})
 
-        cache_key = f'tasks_{request.user.id}'
-        cache.delete(cache_key)  # Очищаем кэш после обновления задачи
-        logger.info("Кэш очищен после обновления задачи")
+        # Если данных нет в кэше, выполняем запрос к базе данных.
+        payload = request.accepted_renderer.render(
+            self.get_list_data(), request.accepted_media_type, self.get_renderer_context(),
+        )
+        # Кэшируем JSON, сброс кэша выполняют сигналы при изменении задач
+        cache.set(cache_key, payload, timeout=TASKS_CACHE_TIMEOUT)
+        logger.debug("Данные закэшированы")
 
-        # Вызываем родительский метод для обновления
-        return super().update(request, *args, **kwargs)
+        return HttpResponse(payload, content_type=request.accepted_renderer.media_type,
+                            headers={'X-Cache': 'MISS'})
 
-    def partial_update(self, request, *args, **kwargs):
+    def get_list_data(self):
         """
-        Частично обновляет задачу. Доступно только для владельца задачи.
-        Очищает кэш для текущего пользователя.
-
-        Args:
-            request: Запрос от клиента.
-            *args: Дополнительные аргументы.
-            **kwargs: Дополнительные именованные аргументы.
+        Выбирает страницу списка задач через `.values()` с учетом фильтров,
+        поиска, сортировки и пагинации текущего запроса.
 
         Returns:
-            Response: Ответ с обновленными данными задачи или ошибкой 403, если пользователь не является владельцем.
+            dict | list: Страница списка задач (со ссылками пагинации) или весь список.
         """
-        instance = self.get_object()
+        queryset = self.filter_queryset(self.get_queryset()).values(*self.list_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page).data
+        return list(queryset)
 
-        # Проверяем, что текущий пользователь является владельцем задачи
-        if instance.user != request.user:
-            return Response(
-                {"detail": "У вас нет прав на частичное обновление этой задачи."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        cache_key = f'tasks_{request.user.id}'
-        cache.delete(cache_key)  # Очищаем кэш после частичного обновления задачи
-        logger.info("Кэш очищен после частичного обновления задачи")
-
-        # Вызываем родительский метод для частичного обновления
-        return super().partial_update(request, *args, **kwargs)
-
-    def destroy(self, request, *args, **kwargs):
+    def perform_create(self, serializer):
         """
-        Удаляет задачу. Доступно только для владельца задачи.
-        Очищает кэш для текущего пользователя.
+        Автоматически привязывает задачу к текущему пользователю при создании.
+        Кэш списка задач сбрасывается сигналом `post_save` (см. signals.py).
 
         Args:
-            request: Запрос от клиента.
-            *args: Дополнительные аргументы.
-            **kwargs: Дополнительные именованные аргументы.
-
-        Returns:
-            Response: Ответ с подтверждением удаления или ошибкой 403, если пользователь не является владельцем.
+            serializer: Сериализатор для создания задачи.
         """
-        instance = self.get_object()
-
-        # Проверяем, что текущий пользователь является владельцем задачи
-        if instance.user != request.user:
-            return Response(
-                {"detail": "У вас нет прав на удаление этой задачи."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        cache_key = f'tasks_{request.user.id}'
-        cache.delete(cache_key)  # Очищаем кэш после удаления задачи
-        logger.info("Кэш очищен после удаления задачи")
+        serializer.save(user=self.request.user)
 
-        # Вызываем родительский метод для удаления
-        return super().destroy(request, *args, **kwargs)
 
-User = get_user_model()
 class UserViewSet(viewsets.ModelViewSet):
     """
         ViewSet для работы с пользователями.
@@ -351,21 +350,41 @@ class UserViewSet(viewsets.ModelViewSet):
         - Для просмотра списка пользователей или деталей пользователя требуется аутентификация.
         - Для создания, обновления и удаления пользователей требуется права администратора.
         """
-    queryset = User.objects.all()
+    # Выбираются только поля UserSerializer (без хэша пароля, last_login и т.д.).
+    queryset = User.objects.only('id', 'username', 'email', 'is_staff')
     serializer_class = UserSerializer
+    # Настройка прав доступа. Классы разрешений не хранят состояния,
+    # поэтому экземпляры создаются один раз и переиспользуются.
+    action_permissions = {
+        # Для просмотра списка пользователей или деталей.
+        'list': (IsAuthenticated(),),
+        'retrieve': (IsAuthenticated(),),
+    }
+    # Для создания, обновления и удаления пользователей
+    default_permissions = (IsAdminUser(),)
+
+    def get_object(self):
+        """
+        Возвращает пользователя для `retrieve`, `update` и т.д.
+
+        Если запрашивается текущий пользователь, возвращается уже загруженный
+        `request.user` без повторного запроса к базе данных.
+
+        Returns:
+            User: Объект пользователя.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if self.action == 'retrieve' and self.kwargs.get(lookup_url_kwarg) == str(self.request.user.pk):
+            user = self.request.user
+            self.check_object_permissions(self.request, user)
+            return user
+        return super().get_object()
 
-    # Настройка прав доступа
     def get_permissions(self):
         """
         Настраивает права доступа в зависимости от действия.
 
         Returns:
-            list: Список классов разрешений, которые будут применены к текущему действию.
+            tuple: Разрешения, которые будут применены к текущему действию.
         """
-        if self.action == 'list' or self.action == 'retrieve':
-            # Для просмотра списка пользователей или деталей.
-            permission_classes = [IsAuthenticated]
-        else:
-            # Для создания, обновления и удаления пользователей
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
\ No newline at end of file
+        return self.action_permissions.get(self.action, self.default_permissions)